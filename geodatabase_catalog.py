@@ -22,9 +22,18 @@
 # ---------------------------------------------------------------------------
 
 import os
+import time
+import fnmatch
 import arcpy
-import datetime
-import pandas as pd
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import xlsxwriter
+
+# OGR is optional; it provides an O(1) stored-row-count fast path
+try:
+    from osgeo import ogr
+except ImportError:
+    ogr = None
 
 # ---------------------------------------------------------------------------
 # CONFIGURATION
@@ -40,16 +49,131 @@ OUTPUT_EXCEL = r"xxx.xlsx"
 # HELPER FUNCTIONS
 # ---------------------------------------------------------------------------
 
-# Convert a filesystem timestamp to a formatted datetime string
+# Convert a filesystem timestamp to a formatted datetime string.
+# time.strftime over time.localtime skips building a datetime object,
+# which matters at inventory-scale call counts.
 def format_timestamp(timestamp):
+    if timestamp is None:
+        return None
     try:
-        return datetime.datetime.fromtimestamp(timestamp).strftime(
-            "%Y-%m-%d %H:%M:%S"
+        return time.strftime(
+            "%Y-%m-%d %H:%M:%S", time.localtime(timestamp)
         )
     except Exception:
         return None
 
-# Build a dictionary describing a single dataset
+# Inventory columns, in output order (cheaper than a per-dataset dict
+# at inventory scale)
+_COLS = (
+    "GDB_Name",
+    "GDB_Path",
+    "GDB_Last_Modified",
+    "Feature_Dataset",
+    "Dataset_Name",
+    "Dataset_Path",
+    "Dataset_Type",
+    "Geometry_Type",
+    "Feature_Count",
+    "Spatial_Reference",
+)
+
+# Per-dataset record; a namedtuple keeps the tuple memory footprint
+# while restoring named field access for sorting and filtering
+DatasetRecord = namedtuple("DatasetRecord", _COLS)
+
+# One open ogr.DataSource per geodatabase, shared by all of its datasets
+_ogr_sources = {}
+
+# Get the row count of a feature class or table without iterating rows.
+# The FGDB stores the count in .gdbtable header metadata, so both the
+# Describe property and the OGR layer expose it in O(1); the O(N)
+# arcpy.management.GetCount tool is only a last resort.
+def get_feature_count(desc, gdb_path, dataset_path):
+    count = desc.get("featureCount")
+    if count is not None:
+        return int(count)
+
+    ds = get_ogr_source(gdb_path)
+    if ds is not None:
+        try:
+            layer = ds.GetLayerByName(desc["name"])
+            if layer is not None:
+                count = layer.GetFeatureCount(force=0)
+                if count < 0:
+                    # Stored count unknown; force a driver-side
+                    # count, still without Python row iteration
+                    count = layer.GetFeatureCount(force=1)
+                if count >= 0:
+                    return int(count)
+        except Exception:
+            pass
+
+    # Last resort: iterate OIDs with a da cursor, which skips the
+    # ~200ms fixed geoprocessing-tool overhead of GetCount per call
+    with arcpy.da.SearchCursor(dataset_path, ["OID@"]) as cursor:
+        return sum(1 for _ in cursor)
+
+# Fetch (and cache) the shared ogr.DataSource for a geodatabase, or
+# None when OGR is unavailable or cannot open it
+def get_ogr_source(gdb_path):
+    if ogr is None:
+        return None
+    try:
+        if gdb_path not in _ogr_sources:
+            _ogr_sources[gdb_path] = ogr.Open(gdb_path)
+        return _ogr_sources[gdb_path]
+    except Exception:
+        return None
+
+# Build a DatasetRecord for a vector dataset from an already-open OGR
+# datasource. One open per geodatabase serves every layer in it, where
+# a describe call re-resolves the catalog per dataset. Returns None if
+# OGR does not know the layer (e.g. rasters), leaving the describe
+# fallback to handle it.
+def describe_dataset_ogr(
+    ogr_ds,
+    gdb_name,
+    gdb_path,
+    gdb_last_modified,
+    dataset_name,
+    dataset_path,
+    feature_dataset=None
+):
+    layer = ogr_ds.GetLayerByName(dataset_name)
+    if layer is None:
+        return None
+
+    geom_type = layer.GetGeomType()
+    if geom_type == ogr.wkbNone:
+        dataset_type = "Table"
+        geometry_type = None
+    else:
+        dataset_type = "FeatureClass"
+        geometry_type = ogr.GeometryTypeToName(geom_type)
+
+    feature_count = layer.GetFeatureCount(force=0)
+    if feature_count < 0:
+        feature_count = layer.GetFeatureCount(force=1)
+    if feature_count < 0:
+        feature_count = None
+
+    srs = layer.GetSpatialRef()
+    spatial_reference = srs.GetName() if srs is not None else None
+
+    return DatasetRecord(
+        GDB_Name=gdb_name,
+        GDB_Path=gdb_path,
+        GDB_Last_Modified=gdb_last_modified,
+        Feature_Dataset=feature_dataset,
+        Dataset_Name=dataset_name,
+        Dataset_Path=dataset_path,
+        Dataset_Type=dataset_type,
+        Geometry_Type=geometry_type,
+        Feature_Count=feature_count,
+        Spatial_Reference=spatial_reference,
+    )
+
+# Build a DatasetRecord describing a single dataset
 def describe_dataset(
     gdb_name,
     gdb_path,
@@ -57,12 +181,14 @@ def describe_dataset(
     dataset_path,
     feature_dataset=None
 ):
-    desc = arcpy.Describe(dataset_path)
+    # da.Describe returns a plain dict in a single round-trip and is
+    # markedly faster than classic arcpy.Describe for bulk enumeration
+    desc = arcpy.da.Describe(dataset_path)
 
-    dataset_type = getattr(desc, "datasetType", "Unknown")
+    dataset_type = desc.get("datasetType", "Unknown")
 
     geometry_type = (
-        getattr(desc, "shapeType", None)
+        desc.get("shapeType")
         if dataset_type == "FeatureClass"
         else None
     )
@@ -71,8 +197,8 @@ def describe_dataset(
     feature_count = None
     try:
         if dataset_type in ("FeatureClass", "Table"):
-            feature_count = int(
-                arcpy.management.GetCount(dataset_path)[0]
+            feature_count = get_feature_count(
+                desc, gdb_path, dataset_path
             )
     except Exception:
         feature_count = None
@@ -80,107 +206,154 @@ def describe_dataset(
     # Get spatial reference name
     spatial_reference = None
     try:
-        if hasattr(desc, "spatialReference") and desc.spatialReference:
-            spatial_reference = desc.spatialReference.name
+        if desc.get("spatialReference"):
+            spatial_reference = desc["spatialReference"].name
     except Exception:
         spatial_reference = None
 
-    return {
-        "GDB_Name": gdb_name,
-        "GDB_Path": gdb_path,
-        "GDB_Last_Modified": gdb_last_modified,
-        "Feature_Dataset": feature_dataset,
-        "Dataset_Name": desc.name,
-        "Dataset_Path": dataset_path,
-        "Dataset_Type": dataset_type,
-        "Geometry_Type": geometry_type,
-        "Feature_Count": feature_count,
-        "Spatial_Reference": spatial_reference,
-    }
+    return DatasetRecord(
+        GDB_Name=gdb_name,
+        GDB_Path=gdb_path,
+        GDB_Last_Modified=gdb_last_modified,
+        Feature_Dataset=feature_dataset,
+        Dataset_Name=desc["name"],
+        Dataset_Path=dataset_path,
+        Dataset_Type=dataset_type,
+        Geometry_Type=geometry_type,
+        Feature_Count=feature_count,
+        Spatial_Reference=spatial_reference,
+    )
 
 # ---------------------------------------------------------------------------
 # GEODATABASE INVENTORY LOGIC
 # ---------------------------------------------------------------------------
 
-# Walk the root directory and inventory all file geodatabases
-def inventory_geodatabases(root_dir):
+# Inventory the contents of a single file geodatabase
+#
+# Must stay safe to run from a worker thread: arcpy.env.workspace is
+# process-global, so the enumeration goes through arcpy.da.Walk, which
+# takes the workspace as an argument instead of mutating shared state.
+def scan_one_gdb(gdb_path, mtime):
     records = []
-
-    for dirpath, dirnames, _ in os.walk(root_dir):
-        for dirname in dirnames:
-            if not dirname.lower().endswith(".gdb"):
-                continue
-
-            gdb_path = os.path.join(dirpath, dirname)
-            print(f"Scanning geodatabase: {gdb_path}")
-
-            # Get geodatabase last modified date
-            try:
-                gdb_last_modified = format_timestamp(
-                    os.path.getmtime(gdb_path)
-                )
-            except Exception:
-                gdb_last_modified = None
-
-            # Set workspace to the geodatabase
-            arcpy.env.workspace = gdb_path
-
-            # Inventory top-level feature classes
-            for fc in arcpy.ListFeatureClasses() or []:
-                records.append(
-                    describe_dataset(
+    dirname = os.path.basename(gdb_path)
+
+    print(f"Scanning geodatabase: {gdb_path}")
+
+    gdb_last_modified = format_timestamp(mtime)
+
+    # One OGR open serves every vector dataset in this geodatabase;
+    # per-dataset describes only remain for rasters and OGR misses
+    ogr_ds = get_ogr_source(gdb_path)
+
+    # Inventory feature classes, tables and rasters in a single catalog
+    # traversal; feature-dataset context falls out of the walk dirpath.
+    # Walk yields clean absolute dirpaths, so plain f-string
+    # concatenation replaces os.path.join's per-component normalization
+    # on this per-dataset hot path.
+    sep = os.sep
+    for dirpath, _, filenames in arcpy.da.Walk(
+        gdb_path, datatype=["FeatureClass", "Table", "RasterDataset"]
+    ):
+        fds = None if dirpath == gdb_path else os.path.basename(dirpath)
+        for fn in filenames:
+            dataset_path = f"{dirpath}{sep}{fn}"
+
+            record = None
+            if ogr_ds is not None:
+                try:
+                    record = describe_dataset_ogr(
+                        ogr_ds,
                         dirname,
                         gdb_path,
                         gdb_last_modified,
-                        os.path.join(gdb_path, fc)
+                        fn,
+                        dataset_path,
+                        feature_dataset=fds
                     )
+                except Exception:
+                    record = None
+
+            if record is None:
+                record = describe_dataset(
+                    dirname,
+                    gdb_path,
+                    gdb_last_modified,
+                    dataset_path,
+                    feature_dataset=fds
                 )
 
-            # Inventory feature datasets and their feature classes
-            for fds in arcpy.ListDatasets("", "Feature") or []:
-                fds_path = os.path.join(gdb_path, fds)
-                arcpy.env.workspace = fds_path
-
-                for fc in arcpy.ListFeatureClasses() or []:
-                    records.append(
-                        describe_dataset(
-                            dirname,
-                            gdb_path,
-                            gdb_last_modified,
-                            os.path.join(fds_path, fc),
-                            feature_dataset=fds
-                        )
-                    )
+            records.append(record)
 
-                # Reset workspace to geodatabase
-                arcpy.env.workspace = gdb_path
+    # Sort within the geodatabase (by feature dataset, dataset name);
+    # the caller streams rows out, so this is the only sorting pass
+    records.sort(key=lambda r: (r.Feature_Dataset or "", r.Dataset_Name))
 
-            # Inventory standalone tables
-            for table in arcpy.ListTables() or []:
-                records.append(
-                    describe_dataset(
-                        dirname,
-                        gdb_path,
-                        gdb_last_modified,
-                        os.path.join(gdb_path, table)
-                    )
-                )
+    return records
 
-            # Inventory rasters
-            for raster in arcpy.ListRasters() or []:
-                records.append(
-                    describe_dataset(
-                        dirname,
-                        gdb_path,
-                        gdb_last_modified,
-                        os.path.join(gdb_path, raster)
-                    )
-                )
+# Walk the root directory and inventory all file geodatabases
+#
+# Uses a manual os.scandir stack instead of os.walk: DirEntry caches the
+# directory/file distinction from the initial readdir, so no extra stat
+# calls are needed per entry, and .gdb directories are never descended
+# into (their internal files are of no interest here).
+#
+# Yields record tuples one at a time so the caller can stream them to
+# disk; only one geodatabase's records are held in memory at once.
+# Geodatabases are dispatched in name order and each scan returns its
+# records pre-sorted, so output stays grouped and ordered per GDB.
+def inventory_geodatabases(root_dir):
+    gdb_paths = []
+    gdb_mtimes = []
+
+    stack = [root_dir]
+    while stack:
+        # Skip unreadable or vanished directories, matching os.walk's
+        # default onerror=None behavior; one ACL-restricted subfolder
+        # must not abort the whole inventory
+        try:
+            with os.scandir(stack.pop()) as it:
+                subdirs = [
+                    entry for entry in it
+                    if entry.is_dir(follow_symlinks=False)
+                ]
+        except OSError:
+            continue
+
+        # Match the whole sibling list at once; fnmatch.filter runs the
+        # compiled pattern in C, which beats a per-name Python
+        # lower().endswith() check in directories with many entries
+        matched = set(fnmatch.filter(
+            [entry.name for entry in subdirs], "*.[gG][dD][bB]"
+        ))
+
+        for entry in subdirs:
+            # A .gdb is a leaf: record it, never descend into its
+            # hundreds of internal .gdbtable/.gdbindexes files
+            if entry.name in matched:
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    mtime = None
+                gdb_paths.append(entry.path)
+                gdb_mtimes.append(mtime)
+            else:
+                stack.append(entry.path)
+
+    if not gdb_paths:
+        return
 
-            # Clear workspace
-            arcpy.env.workspace = None
+    gdb_paths, gdb_mtimes = zip(*sorted(
+        zip(gdb_paths, gdb_mtimes),
+        key=lambda pm: (os.path.basename(pm[0]), pm[0])
+    ))
 
-    return records
+    # Scan geodatabases in parallel; the work is dominated by blocking
+    # arcpy and filesystem calls that release the GIL
+    with ThreadPoolExecutor(
+        max_workers=min(16, len(gdb_paths))
+    ) as executor:
+        for recs in executor.map(scan_one_gdb, gdb_paths, gdb_mtimes):
+            yield from recs
 
 # ---------------------------------------------------------------------------
 # SCRIPT ENTRY POINT
@@ -190,23 +363,36 @@ def inventory_geodatabases(root_dir):
 def main():
     print(f"Starting geodatabase inventory for: {ROOT_DIR}")
 
-    records = inventory_geodatabases(ROOT_DIR)
+    # Stream each record to the workbook as it is produced; with
+    # constant_memory xlsxwriter flushes completed rows to disk, so
+    # peak memory stays bounded regardless of total dataset count
+    print(f"Writing inventory to Excel: {OUTPUT_EXCEL}")
+    wb = xlsxwriter.Workbook(OUTPUT_EXCEL, {"constant_memory": True})
+    ws = wb.add_worksheet("Inventory")
+    ws.write_row(0, 0, _COLS)
 
-    if not records:
+    row = 0
+    try:
+        for row, record in enumerate(
+            inventory_geodatabases(ROOT_DIR), start=1
+        ):
+            ws.write_row(row, 0, record)
+    except BaseException:
+        # Close and remove the partially flushed workbook rather than
+        # leaving a corrupt file behind if the scan fails mid-stream
+        wb.close()
+        try:
+            os.remove(OUTPUT_EXCEL)
+        except OSError:
+            pass
+        raise
+
+    wb.close()
+
+    if row == 0:
         print("No datasets found.")
         return
 
-    # Create DataFrame and sort for readability
-    df = pd.DataFrame(records)
-    df.sort_values(
-        by=["GDB_Name", "Feature_Dataset", "Dataset_Name"],
-        inplace=True
-    )
-
-    # Write output to Excel
-    print(f"Writing inventory to Excel: {OUTPUT_EXCEL}")
-    df.to_excel(OUTPUT_EXCEL, index=False)
-
     print("Inventory complete.")
 
 
@@ -1,147 +1,218 @@
-import os 
+import asyncio
+import io
+import os
 import glob
+import multiprocessing
+import time
 import arcpy
-from datetime import datetime
+from functools import lru_cache
 import datetime as dt
 
+def _format_timestamp(timestamp):
+    """Format a filesystem timestamp as 'YYYY-MM-DD HH:MM:SS'.
+
+    Goes through time.strftime/time.localtime, which avoids building a
+    datetime object per call.
+    """
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+@lru_cache(maxsize=None)
+def _cached_stat(path):
+    """os.stat with memoization; many layers share a data source.
+
+    Returns None for missing paths; stat-and-catch costs one syscall
+    where an exists() pre-check would cost two.
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+@lru_cache(maxsize=4096)
+def _cached_describe(path):
+    """arcpy.da.Describe with memoization, keyed on normalized path.
+
+    Layers across (and within) lyrx files often point at the same data
+    source; caching collapses the repeated describe round-trips to one
+    per distinct source.
+    """
+    return arcpy.da.Describe(path)
+
+def _init_worker():
+    """One-time setup for each pool worker's own ArcPy context."""
+    arcpy.env.overwriteOutput = True
+
+def _process_one_lyrx(file_path):
+    """Extract metadata from a single layer file.
+
+    Returns a (toc_entry, body) pair, or None if the file could not be
+    processed. Runs in a pool worker process; each worker has its own
+    ArcPy context and stat/describe caches, and no shared state is
+    touched.
+    """
+    buf = io.StringIO()
+
+    try:
+        layer_file = arcpy.mp.LayerFile(file_path)
+
+        # Get file metadata
+        file_stats = os.stat(file_path)
+        file_created = _format_timestamp(file_stats.st_ctime)
+        file_modified = _format_timestamp(file_stats.st_mtime)
+        file_size = file_stats.st_size / 1024  # Convert to KB
+
+        file_info = (
+            f"### File Information:\n\n"
+            f"- File Path: {file_path}\n"
+            f"- File Name: {os.path.basename(file_path)}\n"
+            f"- Created: {file_created}\n"
+            f"- Last Modified: {file_modified}\n"
+            f"- File Size: {file_size:.2f} KB\n\n"
+        )
+        buf.write(file_info)
+
+        toc_entry = (
+            f"- {file_path}\n"
+        )
+
+        for layer in layer_file.listLayers():
+            # Add layer name and data source
+            if layer.supports("DATASOURCE"):
+                layer_info = (
+                    f"## Layer: {layer.name}\n\n"
+                    f"Source: {layer.dataSource}\n\n"
+                )
+                buf.write(layer_info)
+
+                # Add data source metadata
+                try:
+                    source_stats = _cached_stat(layer.dataSource)
+                    if source_stats is not None:
+                        source_created = _format_timestamp(source_stats.st_ctime)
+                        source_modified = _format_timestamp(source_stats.st_mtime)
+
+                        source_info = (
+                            f"Data Source Metadata:\n\n"
+                            f"- Created: {source_created}\n"
+                            f"- Last Modified: {source_modified}\n\n"
+                        )
+                        buf.write(source_info)
+                except:
+                    pass
+
+                # Add detailed field information
+                try:
+                    desc = _cached_describe(os.path.normcase(layer.dataSource))
+
+                    # Field details
+                    field_info = "### Fields:\n\n"
+                    for field in desc["fields"]:
+                        field_info += (
+                            f"- {field.name}\n"
+                            f"  - Type: {field.type}\n"
+                            f"  - Length: {field.length}\n"
+                            f"  - Alias: {field.aliasName}\n"
+                            f"  - Nullable: {field.isNullable}\n\n"
+                        )
+                    buf.write(field_info)
+
+                except Exception as e:
+                    buf.write(f"Error reading fields: {str(e)}\n\n")
+
+                # Add layer properties
+                try:
+                    layer_props = "### Layer Properties:\n\n"
+                    layer_props += f"- Description: {layer.metadata.description}\n"
+                    layer_props += f"- Visible: {layer.visible}\n"
+                    layer_props += f"- Min Scale: {layer.metadata.minScale}\n"
+                    layer_props += f"- Max Scale: {layer.metadata.maxScale}\n"
+                    layer_props += f"- Transparency: {layer.transparency}%\n"
+
+                    if layer.supports("DEFINITIONQUERY"):
+                        layer_props += f"- Definition Query: {layer.definitionQuery}\n"
+
+                    buf.write(layer_props + "\n")
+                except Exception as e:
+                    buf.write(f"Error reading layer properties: {str(e)}\n\n")
+
+                # Add symbology information
+                try:
+                    symbology_info = "### Symbology:\n\n"
+
+                    if layer.supports("SYMBOLOGY"):
+                        sym = layer.symbology
+                        symbology_info += f"- Renderer Type: {sym.renderer.type}\n"
+
+                        # For simple renderer
+                        if hasattr(sym.renderer, 'symbol'):
+                            symbol = sym.renderer.symbol
+                            symbology_info += f"- Symbol Type: {symbol.type}\n"
+                            if hasattr(symbol, 'color'):
+                                symbology_info += f"- Color: RGB{symbol.color}\n"
+                            if hasattr(symbol, 'size'):
+                                symbology_info += f"- Size: {symbol.size}\n"
+
+                        # For unique value or graduated renderers
+                        if hasattr(sym.renderer, 'fields'):
+                            symbology_info += f"- Classification Field(s): {sym.renderer.fields}\n"
+
+                        if hasattr(sym.renderer, 'classBreakCount'):
+                            symbology_info += f"- Class Breaks: {sym.renderer.classBreakCount}\n"
+
+                        if hasattr(sym.renderer, 'groups'):
+                            symbology_info += f"- Number of Groups: {len(sym.renderer.groups)}\n"
+
+                    buf.write(symbology_info + "\n")
+                except Exception as e:
+                    buf.write(f"Error reading symbology: {str(e)}\n\n")
+
+    except Exception as e:
+        print(f"Error processing {file_path}: {str(e)}")
+        return None
+
+    return toc_entry, buf.getvalue()
+
 def extract_layer_metadata(lyrx_files):
-    """Extract metadata from layer files."""
-    data_list = []
-    contents = []
+    """Extract metadata from layer files.
+
+    Returns a (contents_buf, body_buf) pair of StringIO buffers holding
+    the table of contents and the report body.
+    """
+    contents_buf = io.StringIO()
+    body_buf = io.StringIO()
 
-    contents_header = (
+    contents_buf.write(
         f"### Table of Contents \n\n"
     )
-    contents.append(contents_header)
-
-    for file_path in lyrx_files:
-        try:
-            layer_file = arcpy.mp.LayerFile(file_path)
-
-            # Get file metadata
-            file_stats = os.stat(file_path)
-            file_created = datetime.fromtimestamp(file_stats.st_ctime).strftime('%Y-%m-%d %H:%M:%S')
-            file_modified = datetime.fromtimestamp(file_stats.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-            file_size = file_stats.st_size / 1024  # Convert to KB
-
-            file_info = (
-                f"### File Information:\n\n"
-                f"- File Path: {file_path}\n"
-                f"- File Name: {os.path.basename(file_path)}\n"
-                f"- Created: {file_created}\n"
-                f"- Last Modified: {file_modified}\n"
-                f"- File Size: {file_size:.2f} KB\n\n"
-            )
-            data_list.append(file_info)
-
-            toc_entry = (
-                f"- {file_path}\n"
-            )
-            contents.append(toc_entry)
-
-            for layer in layer_file.listLayers():
-                # Add layer name and data source
-                if layer.supports("DATASOURCE"):
-                    layer_info = (
-                        f"## Layer: {layer.name}\n\n"
-                        f"Source: {layer.dataSource}\n\n"
-                    )
-                    data_list.append(layer_info)
-
-                    # Add data source metadata
-                    try:
-                        if os.path.exists(layer.dataSource):
-                            source_stats = os.stat(layer.dataSource)
-                            source_created = datetime.fromtimestamp(source_stats.st_ctime).strftime('%Y-%m-%d %H:%M:%S')
-                            source_modified = datetime.fromtimestamp(source_stats.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-
-                            source_info = (
-                                f"Data Source Metadata:\n\n"
-                                f"- Created: {source_created}\n"
-                                f"- Last Modified: {source_modified}\n\n"
-                            )
-                            data_list.append(source_info)
-                    except:
-                        pass
-
-                    # Add detailed field information
-                    try:
-                        desc = arcpy.da.Describe(layer.dataSource)
-
-                        # Field details
-                        field_info = "### Fields:\n\n"
-                        for field in desc["fields"]:
-                            field_info += (
-                                f"- {field.name}\n"
-                                f"  - Type: {field.type}\n"
-                                f"  - Length: {field.length}\n"
-                                f"  - Alias: {field.aliasName}\n"
-                                f"  - Nullable: {field.isNullable}\n\n"
-                            )
-                        data_list.append(field_info)
-
-                    except Exception as e:
-                        data_list.append(f"Error reading fields: {str(e)}\n\n")
-
-                    # Add layer properties
-                    try:
-                        layer_props = "### Layer Properties:\n\n"
-                        layer_props += f"- Description: {layer.metadata.description}\n"
-                        layer_props += f"- Visible: {layer.visible}\n"
-                        layer_props += f"- Min Scale: {layer.metadata.minScale}\n"
-                        layer_props += f"- Max Scale: {layer.metadata.maxScale}\n"
-                        layer_props += f"- Transparency: {layer.transparency}%\n"
-
-                        if layer.supports("DEFINITIONQUERY"):
-                            layer_props += f"- Definition Query: {layer.definitionQuery}\n"
-
-                        data_list.append(layer_props + "\n")
-                    except Exception as e:
-                        data_list.append(f"Error reading layer properties: {str(e)}\n\n")
-
-                    # Add symbology information
-                    try:
-                        symbology_info = "### Symbology:\n\n"
-
-                        if layer.supports("SYMBOLOGY"):
-                            sym = layer.symbology
-                            symbology_info += f"- Renderer Type: {sym.renderer.type}\n"
-
-                            # For simple renderer
-                            if hasattr(sym.renderer, 'symbol'):
-                                symbol = sym.renderer.symbol
-                                symbology_info += f"- Symbol Type: {symbol.type}\n"
-                                if hasattr(symbol, 'color'):
-                                    symbology_info += f"- Color: RGB{symbol.color}\n"
-                                if hasattr(symbol, 'size'):
-                                    symbology_info += f"- Size: {symbol.size}\n"
-
-                            # For unique value or graduated renderers
-                            if hasattr(sym.renderer, 'fields'):
-                                symbology_info += f"- Classification Field(s): {sym.renderer.fields}\n"
-
-                            if hasattr(sym.renderer, 'classBreakCount'):
-                                symbology_info += f"- Class Breaks: {sym.renderer.classBreakCount}\n"
-
-                            if hasattr(sym.renderer, 'groups'):
-                                symbology_info += f"- Number of Groups: {len(sym.renderer.groups)}\n"
-
-                        data_list.append(symbology_info + "\n")
-                    except Exception as e:
-                        data_list.append(f"Error reading symbology: {str(e)}\n\n")
-
-        except Exception as e:
-            print(f"Error processing {file_path}: {str(e)}")
-            continue
-        
-    data_list.insert(0,contents)
-    return data_list
-
-def write_metadata_to_file(data_list, output_file):
-    """Write collected metadata to a markdown file."""
-    current_time = dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
-    with open(output_file, 'w') as md_file:
+
+    # Process layer files in parallel. ArcPy does not reliably release
+    # the GIL while parsing layer files, so worker processes scale where
+    # threads would not; pool.map preserves input order.
+    with multiprocessing.Pool(
+        processes=min(8, os.cpu_count() or 1, len(lyrx_files)),
+        initializer=_init_worker
+    ) as pool:
+        for result in pool.map(_process_one_lyrx, lyrx_files):
+            if result is None:
+                continue
+            toc_entry, body = result
+            contents_buf.write(toc_entry)
+            body_buf.write(body)
+
+    return contents_buf, body_buf
+
+def write_metadata_to_file(buffers, output_file, current_time=None):
+    """Write collected metadata to a markdown file.
+
+    Pass the same current_time to concurrent calls so every copy of the
+    report carries an identical generated timestamp.
+    """
+    contents_buf, body_buf = buffers
+    if current_time is None:
+        current_time = dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    # Large buffer so the report goes out in a handful of write syscalls
+    with open(output_file, 'w', buffering=1 << 20) as md_file:
         md_file.write("# Layer Metadata Report\n\n")
         md_file.write(f"**Generated:** {current_time}\n\n")
         md_file.write(f"**Script Version:** 1.0\n\n")
@@ -149,14 +220,12 @@ def write_metadata_to_file(data_list, output_file):
         md_file.write(f"**Source Directory:** {DIRECTORY_PATH}\n\n")
         md_file.write("---\n\n")
 
-        for data in data_list[0]:
-            md_file.write(data)
-            
+        md_file.write(contents_buf.getvalue())
+
         md_file.write("---\n\n")
-        
-        for data in data_list[1]:
-            md_file.write(data)
-        
+
+        md_file.write(body_buf.getvalue())
+
         md_file.write("\n---\n\n")
         md_file.write(f"**End of Report**\n\n")
         md_file.write(f"Report completed at: {current_time}\n")
@@ -172,15 +241,29 @@ def main():
     print(f"Found {len(lyrx_files)} layer files to process")
     
     # Extract metadata
-    data_list = extract_layer_metadata(lyrx_files)
-    
+    buffers = extract_layer_metadata(lyrx_files)
+
     # Define output file path
     output_file = os.path.join(os.path.dirname(DIRECTORY_PATH), OUTPUT_FILENAME)
     admin_output_file = os.path.join(ADMIN_DIRECTORY_PATH, OUTPUT_FILENAME)
     
     # Write to file
-    write_metadata_to_file(data_list, output_file)
-    write_metadata_to_file(data_list, admin_output_file)
+    # Write both copies concurrently from the in-memory buffers, so
+    # total wall-time is max(local, network share) rather than the sum.
+    # A shared timestamp keeps the two reports bit-identical.
+    current_time = dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    async def _write_both():
+        await asyncio.gather(
+            asyncio.to_thread(
+                write_metadata_to_file, buffers, output_file, current_time
+            ),
+            asyncio.to_thread(
+                write_metadata_to_file, buffers, admin_output_file, current_time
+            ),
+        )
+
+    asyncio.run(_write_both())
     
     print(f"Metadata written to: {output_file}")
 